@@ -41,6 +41,7 @@ class Config:
     SCAN_INTERVAL_SECONDS: int
     POSITION_MONITOR_INTERVAL_SECONDS: int
     RSI_PAIR_COOLDOWN_SECONDS: int
+    ORDER_RECONCILE_INTERVAL_SECONDS: int
 
     # Amounts / fees
     BASE_TRADE_AMOUNT: Decimal
@@ -153,6 +154,7 @@ class Config:
         self.SCAN_INTERVAL_SECONDS = int(os.getenv("SCAN_INTERVAL_SECONDS", "60"))
         self.POSITION_MONITOR_INTERVAL_SECONDS = int(os.getenv("POSITION_MONITOR_INTERVAL_SECONDS", "5"))
         self.RSI_PAIR_COOLDOWN_SECONDS = int(os.getenv("RSI_PAIR_COOLDOWN_SECONDS", "20"))
+        self.ORDER_RECONCILE_INTERVAL_SECONDS = int(os.getenv("ORDER_RECONCILE_INTERVAL_SECONDS", "300"))
 
         # Amounts / fees
         self.BASE_TRADE_AMOUNT = Decimal(os.getenv("BASE_TRADE_AMOUNT", "30.0"))
@@ -220,6 +222,9 @@ class Config:
         if self.RSI_PAIR_COOLDOWN_SECONDS < 0:
             errors.append("RSI_PAIR_COOLDOWN_SECONDS must be non-negative")
 
+        if self.ORDER_RECONCILE_INTERVAL_SECONDS <= 0:
+            errors.append("ORDER_RECONCILE_INTERVAL_SECONDS must be positive")
+
         if self.MAX_POSITION_SIZE <= 0:
             errors.append("MAX_POSITION_SIZE must be positive")
 
@@ -278,6 +283,7 @@ class Config:
         Position Timeout: {self.POSITION_TIMEOUT_MINUTES}m
         Scan Interval: {self.SCAN_INTERVAL_SECONDS}s
         Monitor Interval: {self.POSITION_MONITOR_INTERVAL_SECONDS}s
+        Order Reconcile Interval: {self.ORDER_RECONCILE_INTERVAL_SECONDS}s
         Max Position Size: {self.MAX_POSITION_SIZE}
         Max Daily Trades: {self.MAX_DAILY_TRADES}
         Max Retries: {self.MAX_RETRIES}
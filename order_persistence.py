@@ -5,6 +5,7 @@ Handles saving and loading active orders for crash recovery.
 
 import json
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -86,6 +87,8 @@ class OrderPersistence:
         self.logger = get_logger("order_persistence")
         self.orders_file = Path(config.ORDERS_FILE_PATH)
         self.active_orders: Dict[str, OrderRecord] = {}
+        # Orders may be updated from the trading engine's close-position workers
+        self._lock = threading.RLock()
         
         # Create data directory if it doesn't exist
         self.orders_file.parent.mkdir(parents=True, exist_ok=True)
@@ -115,39 +118,49 @@ class OrderPersistence:
             status="active"
         )
         
-        self.active_orders[order_id] = order_record
-        self.logger.debug(f"Added order to persistence: {order_record}")
-        
-        # Save immediately
-        self.save_orders()
+        with self._lock:
+            self.active_orders[order_id] = order_record
+            self.logger.debug(f"Added order to persistence: {order_record}")
+            
+            # Save immediately
+            self.save_orders()
     
     def update_order_status(self, order_id: str, status: str) -> None:
         """Update the status of an order."""
-        if not self.config.ENABLE_ORDER_PERSISTENCE or order_id not in self.active_orders:
+        if not self.config.ENABLE_ORDER_PERSISTENCE:
             return
         
-        self.active_orders[order_id].status = status
-        self.active_orders[order_id].last_updated = datetime.now(timezone.utc)
-        
-        # Remove from active orders if completed or cancelled
-        if status in ["filled", "cancelled", "rejected"]:
-            self.remove_order(order_id)
-        else:
-            self.save_orders()
+        with self._lock:
+            if order_id not in self.active_orders:
+                return
+            
+            self.active_orders[order_id].status = status
+            self.active_orders[order_id].last_updated = datetime.now(timezone.utc)
+            
+            # Remove from active orders if completed or cancelled
+            if status in ["filled", "cancelled", "rejected"]:
+                self.remove_order(order_id)
+            else:
+                self.save_orders()
     
     def remove_order(self, order_id: str) -> bool:
         """Remove an order from active tracking."""
-        if not self.config.ENABLE_ORDER_PERSISTENCE or order_id not in self.active_orders:
+        if not self.config.ENABLE_ORDER_PERSISTENCE:
             return False
         
-        removed_order = self.active_orders.pop(order_id)
-        self.logger.debug(f"Removed order from persistence: {removed_order}")
-        self.save_orders()
-        return True
+        with self._lock:
+            if order_id not in self.active_orders:
+                return False
+            
+            removed_order = self.active_orders.pop(order_id)
+            self.logger.debug(f"Removed order from persistence: {removed_order}")
+            self.save_orders()
+            return True
     
     def get_active_orders(self) -> List[OrderRecord]:
         """Get all active orders."""
-        return list(self.active_orders.values())
+        with self._lock:
+            return list(self.active_orders.values())
     
     def get_order_by_id(self, order_id: str) -> Optional[OrderRecord]:
         """Get a specific order by ID."""
@@ -163,19 +176,20 @@ class OrderPersistence:
             return
         
         try:
-            orders_data = {
-                "version": "1.0",
-                "saved_at": datetime.now(timezone.utc).isoformat(),
-                "orders": [order.to_dict() for order in self.active_orders.values()]
-            }
-            
-            # Write to temporary file first, then rename to avoid corruption
-            temp_file = self.orders_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(orders_data, f, indent=2)
-            
-            # Atomic rename
-            temp_file.rename(self.orders_file)
+            with self._lock:
+                orders_data = {
+                    "version": "1.0",
+                    "saved_at": datetime.now(timezone.utc).isoformat(),
+                    "orders": [order.to_dict() for order in self.active_orders.values()]
+                }
+                
+                # Write to temporary file first, then rename to avoid corruption
+                temp_file = self.orders_file.with_suffix('.tmp')
+                with open(temp_file, 'w') as f:
+                    json.dump(orders_data, f, indent=2)
+                
+                # Atomic rename
+                temp_file.rename(self.orders_file)
             
             self.logger.debug(f"Saved {len(self.active_orders)} active orders to {self.orders_file}")
             
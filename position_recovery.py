@@ -25,7 +25,7 @@ def recover_positions_from_valr(api: VALRAPI) -> List[Dict[str, Any]]:
 
     try:
         # Get all open orders from VALR
-        open_orders = api.get_open_orders()
+        open_orders, _ = api.get_open_orders()
         logger.info(f"Fetched {len(open_orders)} open orders from VALR for position recovery")
 
         # DEBUG: Log all orders
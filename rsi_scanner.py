@@ -11,7 +11,6 @@ from __future__ import annotations
 
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone
-import time
 
 from valr_api import VALRAPI
 from config import Config
@@ -19,6 +18,11 @@ from logging_setup import get_logger, get_valr_logger
 from decimal_utils import DecimalUtils
 
 
+# RSI lookback; the calculation needs one more price point than the period
+RSI_PERIOD = 14
+RSI_MIN_CANDLES = RSI_PERIOD + 1
+
+
 class RSIScannerError(Exception):
     """Raised when RSI scanning operations fail."""
 
@@ -44,7 +48,7 @@ class RSIScanner:
         if len(history) > self._max_history:
             self._price_history[pair] = history[-self._max_history :]
 
-    def _aggregate_trades_to_1m_candles(self, trades: List[Dict], min_candles: int = 15) -> List[float]:
+    def _aggregate_trades_to_1m_candles(self, trades: List[Dict], min_candles: int = RSI_MIN_CANDLES) -> List[float]:
         """Aggregate recent trades into 1-minute candles and return close prices.
         
         For RSI calculation on 1-minute timeframe, we need at least 15 close prices.
@@ -141,7 +145,9 @@ class RSIScanner:
         
         return close_prices
 
-    def _initialize_price_history(self, pair: str, min_candles: int = 15) -> bool:
+    def _initialize_price_history(
+        self, pair: str, min_candles: int = RSI_MIN_CANDLES, trades: Optional[List[Dict]] = None
+    ) -> bool:
         """Initialize price history for a pair if not enough data exists.
         
         Fetches recent trades and aggregates them into 1-minute candles
@@ -150,6 +156,7 @@ class RSIScanner:
         Args:
             pair: Trading pair to initialize
             min_candles: Minimum number of candles needed
+            trades: Recent trades already fetched for the pair; fetched here if omitted
             
         Returns:
             True if successfully initialized with enough data, False otherwise
@@ -159,8 +166,9 @@ class RSIScanner:
             return True  # Already have enough data
         
         try:
-            self.logger.info(f"Fetching historical trades for {pair} to initialize RSI calculation...")
-            trades = self.api.get_recent_trades(pair, limit=100)
+            if trades is None:
+                self.logger.info(f"Fetching historical trades for {pair} to initialize RSI calculation...")
+                trades = self.api.get_recent_trades(pair, limit=100)
             
             if not trades:
                 self.logger.warning(f"No trades available for {pair}")
@@ -183,7 +191,7 @@ class RSIScanner:
             self.logger.error(f"Failed to initialize price history for {pair}: {e}")
             return False
 
-    def _calculate_rsi(self, prices: List[float], period: int = 14) -> Optional[float]:
+    def _calculate_rsi(self, prices: List[float], period: int = RSI_PERIOD) -> Optional[float]:
         if len(prices) < period + 1:
             return None
 
@@ -205,11 +213,14 @@ class RSIScanner:
         rsi = 100.0 - (100.0 / (1.0 + rs))
         return rsi
 
-    def get_rsi(self, pair: str, period: int = 14) -> Tuple[Optional[float], Optional[float], int, str]:
+    def get_rsi(
+        self, pair: str, period: int = RSI_PERIOD, history_seeded: bool = False
+    ) -> Tuple[Optional[float], Optional[float], int, str]:
         """Get RSI data for scalp trading signals.
         
         Uses VALR's recent trades to build 1-minute candles for RSI calculation.
-        Initializes price history automatically if not enough data is available.
+        Initializes price history automatically if not enough data is available,
+        unless history_seeded says this scan already fetched trades for the pair.
 
         Returns:
             Tuple of (rsi_value, last_price, history_len, error_msg)
@@ -221,11 +232,16 @@ class RSIScanner:
         try:
             # Initialize price history if needed (first scan or insufficient data)
             current_history = self._price_history.get(pair, [])
-            if len(current_history) < min_candles:
-                self._initialize_price_history(pair, min_candles)
+            if len(current_history) < min_candles and not history_seeded:
+                # Seed history and fetch the current price in parallel
+                _, price_data = self.api.fetch_concurrently(
+                    lambda: self._initialize_price_history(pair, min_candles),
+                    lambda: self.api.get_last_traded_price(pair),
+                )
+            else:
+                price_data = self.api.get_last_traded_price(pair)
             
-            # Get current price and add to history
-            price_data = self.api.get_last_traded_price(pair)
+            # Add current price to history
             last_price = float(price_data)
             if last_price <= 0:
                 return None, last_price, 0, "Invalid price"
@@ -245,12 +261,12 @@ class RSIScanner:
         except Exception as e:
             return None, last_price, history_len, str(e)
 
-    def scan_pair(self, pair: str) -> Tuple[bool, Optional[float]]:
+    def scan_pair(self, pair: str, history_seeded: bool = False) -> Tuple[bool, Optional[float]]:
         if self._is_in_cooldown(pair):
             self.logger.debug(f"Pair {pair} is in cooldown, skipping scan")
             return False, None
 
-        rsi_value, last_price, history_len, error_msg = self.get_rsi(pair)
+        rsi_value, last_price, history_len, error_msg = self.get_rsi(pair, history_seeded=history_seeded)
         
         is_oversold = False
         if rsi_value is not None:
@@ -282,10 +298,24 @@ class RSIScanner:
 
         self.logger.info(f"Scanning {len(pairs)} pairs for oversold conditions (Threshold: {self.config.RSI_THRESHOLD})")
 
+        # Seed every pair still short of candles in one concurrent round of trade fetches.
+        # Seeded pairs skip get_rsi's own trade fetch this scan even if they stay short.
+        seeded = set()
+        pending = [
+            pair
+            for pair in pairs
+            if len(self._price_history.get(pair, [])) < RSI_MIN_CANDLES and not self._is_in_cooldown(pair)
+        ]
+        if len(pending) > 1:
+            self.logger.info(f"Fetching historical trades for {len(pending)} pairs to initialize RSI calculation...")
+            for pair, trades in self.api.get_recent_trades_batch(pending, limit=100).items():
+                self._initialize_price_history(pair, trades=trades)
+            seeded.update(pending)
+
         results: List[Dict] = []
         for pair in pairs:
             try:
-                is_oversold, rsi_value = self.scan_pair(pair)
+                is_oversold, rsi_value = self.scan_pair(pair, history_seeded=pair in seeded)
                 results.append(
                     {
                         "pair": pair,
@@ -295,7 +325,6 @@ class RSIScanner:
                         "timestamp": datetime.now().isoformat(),
                     }
                 )
-                time.sleep(0.05)
             except Exception as e:
                 self.logger.error(f"Failed to scan pair {pair}: {e}")
                 results.append(
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Test script to verify VALR request retries and rate limiting.
+Runs offline: the connection pool is replaced with scripted responses.
+"""
+
+import os
+import sys
+import threading
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+# Retries need no real credentials; Config refuses to load without them
+os.environ.setdefault("VALR_API_KEY", "test-key")
+os.environ.setdefault("VALR_API_SECRET", "test-secret")
+
+import urllib3
+from urllib3.exceptions import ReadTimeoutError
+
+from config import Config
+from logging_setup import setup_logging
+from valr_api import VALRAPI, VALRConnectionError
+
+
+class FakeResponse:
+    """Minimal stand-in for the urllib3 response fields _send reads."""
+
+    def __init__(self, status, data=b"{}", headers=None):
+        self.status = status
+        self.data = data
+        self.headers = urllib3.HTTPHeaderDict(headers or {})
+
+
+def make_api(backoff_factor=0.05, max_retries=2):
+    config = Config()
+    setup_logging(config)
+    # Short backoff keeps the script fast; set after Config() since validation requires > 1
+    config.RETRY_BACKOFF_FACTOR = backoff_factor
+    config.MAX_RETRIES = max_retries
+    # Skip the network warm-up; every request is answered by the scripted pool below
+    with patch.object(VALRAPI, "_warm_up"):
+        return VALRAPI(config)
+
+
+def scripted(api, responses):
+    """Answer successive requests from responses; exceptions are raised instead of returned."""
+    calls = []
+    queue = list(responses)
+
+    def urlopen(method, url, body=None, headers=None, timeout=None):
+        calls.append((method, url))
+        result = queue.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    api.pool.urlopen = urlopen
+    return calls
+
+
+def record_pauses(api):
+    pauses = []
+    original = api.rate_limiter.pause
+
+    def pause(seconds):
+        pauses.append(seconds)
+        original(seconds)
+
+    api.rate_limiter.pause = pause
+    return pauses
+
+
+def test_rate_limited_retry_after_seconds():
+    """Test that a 429 with Retry-After in seconds pauses the limiter for that long."""
+    api = make_api()
+    calls = scripted(api, [FakeResponse(429, headers={"Retry-After": "0.3"}), FakeResponse(200)])
+    pauses = record_pauses(api)
+
+    start = time.monotonic()
+    api._get("/public/BTCZAR/trades")
+    elapsed = time.monotonic() - start
+
+    passed = len(calls) == 2 and pauses == [0.3] and elapsed >= 0.3
+    print(f"{'✅' if passed else '❌'} 429 Retry-After seconds: {len(calls)} calls, pauses={pauses}, {elapsed:.2f}s")
+    api._fetch_pool.shutdown(wait=False)
+    return passed
+
+
+def test_rate_limited_retry_after_http_date():
+    """Test that a 429 with Retry-After as an HTTP-date is honoured."""
+    api = make_api()
+    retry_at = formatdate(time.time() + 1, usegmt=True)
+    calls = scripted(api, [FakeResponse(429, headers={"Retry-After": retry_at}), FakeResponse(200)])
+    pauses = record_pauses(api)
+
+    api._get("/public/BTCZAR/trades")
+
+    # HTTP-dates have one-second resolution, so the wait lands anywhere in [0, 1]
+    passed = len(calls) == 2 and len(pauses) == 1 and 0.0 <= pauses[0] <= 1.0
+    print(f"{'✅' if passed else '❌'} 429 Retry-After HTTP-date: {len(calls)} calls, pauses={pauses}")
+    api._fetch_pool.shutdown(wait=False)
+    return passed
+
+
+def test_server_error_retry():
+    """Test that a 5xx is retried without pausing the shared limiter."""
+    api = make_api()
+    calls = scripted(api, [FakeResponse(503), FakeResponse(200)])
+    pauses = record_pauses(api)
+
+    response = api._get("/public/BTCZAR/trades")
+
+    passed = len(calls) == 2 and response.status_code == 200 and pauses == []
+    print(f"{'✅' if passed else '❌'} 5xx retry: {len(calls)} calls, status={response.status_code}, pauses={pauses}")
+    api._fetch_pool.shutdown(wait=False)
+    return passed
+
+
+def test_transport_error_gives_up():
+    """Test that repeated transport errors end in VALRConnectionError after MAX_RETRIES retries."""
+    api = make_api(max_retries=2)
+    timeout = ReadTimeoutError(api.pool, "/v1/public/BTCZAR/trades", "Read timed out.")
+    calls = scripted(api, [timeout, timeout, timeout])
+    pauses = record_pauses(api)
+
+    try:
+        api._get("/public/BTCZAR/trades")
+        raised = False
+    except VALRConnectionError:
+        raised = True
+
+    passed = raised and len(calls) == 3 and pauses == []
+    print(f"{'✅' if passed else '❌'} Transport errors: {len(calls)} calls, VALRConnectionError raised={raised}")
+    api._fetch_pool.shutdown(wait=False)
+    return passed
+
+
+def test_backoff_does_not_block_other_callers():
+    """Test that one caller's retry backoff does not delay an unrelated request on another thread."""
+    api = make_api(backoff_factor=1.0, max_retries=1)
+    failed_once = threading.Event()
+    read_timeout = ReadTimeoutError(api.pool, "/v1/public/BTCZAR/trades", "Read timed out.")
+
+    def urlopen(method, url, body=None, headers=None, timeout=None):
+        if url.endswith("/trades") and not failed_once.is_set():
+            failed_once.set()
+            raise read_timeout
+        return FakeResponse(200)
+
+    api.pool.urlopen = urlopen
+
+    reader = threading.Thread(target=api._get, args=("/public/BTCZAR/trades",))
+    reader.start()
+    failed_once.wait(5)
+    # Give the reader time to enter its backoff, roughly a second long
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    api._delete("/orders/order", {"orderId": "abc", "pair": "BTCZAR"})
+    elapsed = time.monotonic() - start
+    reader.join()
+
+    passed = elapsed < 0.2
+    print(f"{'✅' if passed else '❌'} Backoff isolation: cancel finished in {elapsed:.3f}s during another call's backoff")
+    api._fetch_pool.shutdown(wait=False)
+    return passed
+
+
+def main():
+    """Run all tests"""
+    print("🧪 Testing Request Retries & Rate Limiting...")
+    print("=" * 50)
+
+    results = [
+        test_rate_limited_retry_after_seconds(),
+        test_rate_limited_retry_after_http_date(),
+        test_server_error_retry(),
+        test_transport_error_gives_up(),
+        test_backoff_does_not_block_other_callers(),
+    ]
+    print()
+
+    if all(results):
+        print("🎉 ALL TESTS PASSED! Retries back off correctly and only 429s pause other callers.")
+        return 0
+
+    print("❌ Some tests failed. Please review the retry logic.")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
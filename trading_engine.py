@@ -5,9 +5,13 @@ Handles order placement, scalp-specific order management, and risk management.
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple, Any
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple, Any
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from functools import lru_cache
+import threading
 import time
 
 from valr_api import VALRAPI, VALRAPIError
@@ -27,18 +31,38 @@ class InsufficientBalanceError(TradingError):
     """Raised when account balance is insufficient for trading."""
 
 
+@dataclass(frozen=True)
+class DailyStats:
+    """Immutable snapshot of the current day's trading counters.
+
+    Updates swap in a new instance, so readers always see a consistent set of values.
+    """
+
+    trade_date: date
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    pnl: Decimal = Decimal("0")
+
+
+_FILLED_TOKENS = frozenset({"FILLED", "COMPLETE", "COMPLETED", "DONE"})
+_CANCELLED_TOKENS = frozenset({"CANCELLED", "CANCELED", "REJECTED", "EXPIRED"})
+
+
 def _normalize_status(value: Optional[str]) -> str:
     if not value:
         return ""
     return str(value).strip().upper()
 
 
+@lru_cache(maxsize=64)
 def _status_is_filled(status: str) -> bool:
-    return any(token in status for token in ["FILLED", "COMPLETE", "COMPLETED", "DONE"])
+    return any(token in status for token in _FILLED_TOKENS)
 
 
+@lru_cache(maxsize=64)
 def _status_is_cancelled(status: str) -> bool:
-    return any(token in status for token in ["CANCELLED", "CANCELED", "REJECTED", "EXPIRED"])
+    return any(token in status for token in _CANCELLED_TOKENS)
 
 
 class PositionManager:
@@ -52,6 +76,11 @@ class PositionManager:
         self.position_persistence = get_position_persistence()
         self.active_positions: Dict[str, Dict[str, Any]] = {}
 
+        # Writers serialize on the lock and publish a fresh immutable snapshot of
+        # open positions; readers take the current snapshot without locking
+        self._lock = threading.Lock()
+        self._open_snapshot: Tuple[Dict[str, Any], ...] = ()
+
         # Load existing positions on startup
         self._load_positions()
 
@@ -82,8 +111,10 @@ class PositionManager:
             "stop_loss_order_id": None,
         }
 
-        self.active_positions[position_id] = position
-        self._save_positions()
+        with self._lock:
+            self.active_positions[position_id] = position
+            self._publish_snapshot()
+            self._save_positions()
 
         self.valr_logger.log_position_update(
             pair=pair,
@@ -99,35 +130,55 @@ class PositionManager:
         """Load positions from persistence on startup."""
         loaded_positions = self.position_persistence.load_positions()
         if loaded_positions:
-            self.active_positions = loaded_positions
+            with self._lock:
+                self.active_positions = loaded_positions
+                self._publish_snapshot()
             self.logger.info(f"Restored {len(loaded_positions)} positions from persistence")
         else:
             # No persisted positions - try to recover from VALR API
             self.logger.info("No persisted positions found. Attempting recovery from VALR API...")
             recovered = recover_positions_from_valr(self.api)
             if recovered:
-                for position in recovered:
-                    self.active_positions[position["id"]] = position
-                self._save_positions()
+                with self._lock:
+                    for position in recovered:
+                        self.active_positions[position["id"]] = position
+                    self._publish_snapshot()
+                    self._save_positions()
                 self.logger.info(f"Recovered and saved {len(recovered)} positions from VALR")
 
+    def _publish_snapshot(self) -> None:
+        """Rebuild the open-positions snapshot. Caller must hold ``self._lock``."""
+        self._open_snapshot = tuple(pos for pos in self.active_positions.values() if pos.get("status") == "open")
+
     def _save_positions(self) -> None:
         """Save positions to persistence."""
         self.position_persistence.save_positions(self.active_positions)
 
     def attach_exit_orders(self, position_id: str, tp_order_id: str, sl_order_id: str) -> None:
-        position = self.active_positions.get(position_id)
-        if not position:
-            return
-        position["take_profit_order_id"] = tp_order_id
-        position["stop_loss_order_id"] = sl_order_id
-        self._save_positions()
+        with self._lock:
+            position = self.active_positions.get(position_id)
+            if not position:
+                return
+            # Replace rather than mutate: the old dict may be held by a reader's snapshot
+            self.active_positions[position_id] = {
+                **position,
+                "take_profit_order_id": tp_order_id,
+                "stop_loss_order_id": sl_order_id,
+            }
+            self._publish_snapshot()
+            self._save_positions()
 
     def close_position(self, position_id: str, reason: str, exit_price: Optional[Decimal] = None) -> Optional[Decimal]:
         """Close position and return PnL."""
-        position = self.active_positions.get(position_id)
-        if not position:
-            return None
+        with self._lock:
+            position = self.active_positions.pop(position_id, None)
+            if not position:
+                return None
+            self._publish_snapshot()
+            self.position_persistence.delete_position(position_id)
+
+        # Work on a private copy; readers may still hold the original via an older snapshot
+        position = dict(position)
 
         # Calculate PnL
         pnl = None
@@ -153,13 +204,11 @@ class PositionManager:
             pnl=float(pnl) if pnl else 0.0,
         )
 
-        del self.active_positions[position_id]
-        self.position_persistence.delete_position(position_id)
-
         return pnl
 
-    def get_open_positions(self) -> List[Dict[str, Any]]:
-        return [pos for pos in self.active_positions.values() if pos.get("status") == "open"]
+    def get_open_positions(self) -> Tuple[Dict[str, Any], ...]:
+        """Return the current snapshot of open positions (lock-free, do not mutate)."""
+        return self._open_snapshot
 
 
 class VALRTradingEngine:
@@ -174,13 +223,16 @@ class VALRTradingEngine:
         self.position_manager = PositionManager(api, config)
         self.order_persistence = get_order_persistence()
 
-        self.trades_today = 0
-        self.last_trade_date = datetime.now(timezone.utc).date()
-        self.daily_pnl = Decimal("0")
+        # Workers for issuing exit-order cancellations in parallel when closing a position
+        self._close_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="close_position")
+
+        # Timeout thresholds are fixed for the lifetime of the engine
+        self._pos_timeout = timedelta(minutes=config.POSITION_TIMEOUT_MINUTES)
+        self._exit_timeout = timedelta(minutes=config.EXIT_ORDER_TIMEOUT_MINUTES)
 
-        # Win/loss tracking
-        self.wins_today = 0
-        self.losses_today = 0
+        # Daily trade/win/loss/PnL counters, replaced atomically under the lock
+        self._stats_lock = threading.Lock()
+        self._stats = DailyStats(trade_date=datetime.now(timezone.utc).date())
 
         # Reference to parent bot for shutdown detection
         self.bot = None
@@ -195,17 +247,13 @@ class VALRTradingEngine:
         balances = self.api.get_account_balances()
         return balances.get(currency, Decimal("0"))
 
-    def check_balance(self, currency: str, required_amount: Decimal) -> bool:
+    def _get_balances_for_check(self, currency: str) -> Dict[str, Decimal]:
+        # A failed fetch counts as no balance, so the trade is skipped rather than aborted
         try:
-            available = self.get_available_balance(currency)
-            sufficient = available >= required_amount
-            self.logger.debug(
-                f"Balance check for {currency}: available={available}, required={required_amount}, sufficient={sufficient}"
-            )
-            return sufficient
+            return self.api.get_account_balances()
         except Exception as e:
             self.logger.error(f"Failed to check balance for {currency}: {e}")
-            return False
+            return {}
 
     def _extract_order_status(self, order_data: Dict[str, Any]) -> str:
         return _normalize_status(
@@ -389,13 +437,17 @@ class VALRTradingEngine:
         6. Monitor position with 30-minute timeout
         """
         try:
-            if self._is_daily_limit_reached():
+            if self._daily_limit_reached(self._maybe_roll_date()):
                 self.logger.warning(f"Daily trade limit reached, skipping {pair}")
                 return None
 
             quote_currency = self._get_quote_currency(pair)
 
-            best_bid, best_ask = self._get_best_bid_ask(pair)
+            # Book and balances are independent; fetch them in parallel
+            (best_bid, best_ask), balances = self.api.fetch_concurrently(
+                lambda: self._get_best_bid_ask(pair),
+                lambda: self._get_balances_for_check(quote_currency),
+            )
             if best_bid is None and best_ask is None:
                 self.logger.warning(f"No order book available for {pair}")
                 return None
@@ -422,8 +474,8 @@ class VALRTradingEngine:
             TAKER_FEE_PERCENT = Decimal("0.5")  # VALR taker fee
             required_quote = trade_amount_quote + (trade_amount_quote * (TAKER_FEE_PERCENT / Decimal("100"))) + BALANCE_SAFETY_BUFFER
 
-            if not self.check_balance(quote_currency, required_quote):
-                available = self.get_available_balance(quote_currency)
+            available = balances.get(quote_currency, Decimal("0"))
+            if available < required_quote:
                 self.logger.debug(
                     f"Balance check failed: required={required_quote} (includes {BALANCE_SAFETY_BUFFER} buffer), "
                     f"available={available}, shortfall={required_quote - available}"
@@ -673,6 +725,10 @@ class VALRTradingEngine:
     def _cancel_if_open(self, order_id: Optional[str], pair: Optional[str] = None, max_retries: int = 3) -> bool:
         """Cancel an order if it's still open.
 
+        The persisted order status is updated from what this call observes
+        (already filled/cancelled, or accepted cancellation), so callers do not
+        need to query the order status again afterwards.
+
         Returns:
             True if order was cancelled or already filled/cancelled, False if cancellation failed
         """
@@ -686,15 +742,20 @@ class VALRTradingEngine:
                 status = self._extract_order_status(status_data)
 
                 # If already filled or cancelled, no need to cancel
-                if _status_is_filled(status) or _status_is_cancelled(status):
+                if _status_is_filled(status):
+                    self.order_persistence.update_order_status(order_id, "filled")
+                    return True
+                if _status_is_cancelled(status):
+                    self.order_persistence.update_order_status(order_id, "cancelled")
                     return True
 
                 # Attempt cancellation
-                if pair:
-                    self.api.cancel_order(order_id, pair=pair)
-                else:
-                    self.api.cancel_order(order_id)
+                cancelled = self.api.cancel_order(order_id, pair=pair) if pair else self.api.cancel_order(order_id)
+                if not cancelled:
+                    raise TradingError(f"Exchange did not accept cancellation of order {order_id}")
 
+                # A 2xx from the exchange is authoritative; record it locally instead of polling again
+                self.order_persistence.update_order_status(order_id, "cancelled")
                 self.logger.debug(f"Successfully cancelled order {order_id}")
                 return True
 
@@ -729,18 +790,46 @@ class VALRTradingEngine:
         except Exception:
             return
 
+    def reconcile_order_statuses(self) -> int:
+        """Reconcile locally tracked orders against the exchange.
+
+        Only orders still marked active locally are considered; once an order
+        is recorded as filled or cancelled it leaves the active set and is not
+        revisited. This low-frequency pass picks up active orders that were
+        filled or cancelled on the exchange without the bot noticing. A single
+        open-orders call is used to skip orders that are still live; only
+        orders that disappeared from the book are queried individually.
+
+        Returns:
+            Number of tracked orders that were checked against the exchange
+        """
+        tracked = self.order_persistence.get_active_orders()
+        if not tracked:
+            return 0
+
+        _, open_order_ids = self.api.get_open_orders()
+
+        checked = 0
+        for record in tracked:
+            if record.order_id in open_order_ids:
+                continue
+            self._sync_persisted_order_status(record.order_id, pair=record.pair)
+            checked += 1
+        return checked
+
     def _close_position_at_market(self, position: Dict[str, Any], reason: str) -> None:
         pair = position["pair"]
         position_id = position["id"]
 
         tp_id = position.get("take_profit_order_id")
         sl_id = position.get("stop_loss_order_id")
-        self._cancel_if_open(tp_id, pair=pair)
-        self._cancel_if_open(sl_id, pair=pair)
-        if tp_id:
-            self._sync_persisted_order_status(tp_id, pair=pair)
-        if sl_id:
-            self._sync_persisted_order_status(sl_id, pair=pair)
+        # Cancel both exit orders concurrently; the market order only goes out once both have settled
+        cancels = [
+            self._close_pool.submit(self._cancel_if_open, order_id, pair=pair)
+            for order_id in (tp_id, sl_id)
+            if order_id
+        ]
+        wait(cancels)
 
         qty_decimals = self.config.get_pair_quantity_decimals(pair)
         formatted_qty = DecimalUtils.format_quantity(position["quantity"], qty_decimals)
@@ -778,10 +867,13 @@ class VALRTradingEngine:
         if not open_positions:
             return
 
+        now = datetime.now(timezone.utc)
+        # Roll the daily counters before any close below records a win or loss
+        self._maybe_roll_date(now.date())
         for position in open_positions:
-            self._monitor_single_position(position)
+            self._monitor_single_position(position, now)
 
-    def _monitor_single_position(self, position: Dict[str, Any]) -> None:
+    def _monitor_single_position(self, position: Dict[str, Any], now: datetime) -> None:
         """Monitor position for scalp trading with proper timeouts.
 
         For scalp trading, positions should be closed quickly:
@@ -797,13 +889,13 @@ class VALRTradingEngine:
         entry_filled_at: datetime = position.get("entry_filled_at") or position.get("created_at")
 
         # Scalp trading: close position after 30 minutes maximum
-        if datetime.now(timezone.utc) > entry_filled_at + timedelta(minutes=self.config.POSITION_TIMEOUT_MINUTES):
+        if now > entry_filled_at + self._pos_timeout:
             self.logger.warning(f"Position timeout for {pair} (30min max). Closing at market...")
             self._close_position_at_market(position, reason="position_timeout")
             return
 
         # Exit orders must fill within 10 minutes or close position
-        if datetime.now(timezone.utc) > entry_filled_at + timedelta(minutes=self.config.EXIT_ORDER_TIMEOUT_MINUTES):
+        if now > entry_filled_at + self._exit_timeout:
             self.logger.warning(f"Exit orders timeout for {pair} (10min max). Closing position...")
             self._close_position_at_market(position, reason="exit_orders_timeout")
             return
@@ -816,8 +908,7 @@ class VALRTradingEngine:
         if tp_id or sl_id:
             # Get all open orders from VALR to verify TP/SL still exist
             try:
-                open_orders = self.api.get_open_orders(pair=pair)
-                open_order_ids = {str(order.get("orderId") or order.get("id") or "") for order in open_orders}
+                _, open_order_ids = self.api.get_open_orders(pair=pair)
 
                 tp_exists = tp_id in open_order_ids if tp_id else False
                 sl_exists = sl_id in open_order_ids if sl_id else False
@@ -837,8 +928,6 @@ class VALRTradingEngine:
                 if not tp_exists and sl_exists:
                     self.logger.info(f"TP order {tp_id} not found on VALR for {pair}. Likely filled. Cancelling SL...")
                     self._cancel_if_open(sl_id, pair=pair)
-                    if sl_id:
-                        self.order_persistence.update_order_status(sl_id, "cancelled")
                     # Position already sold via TP, just close tracking
                     self.position_manager.close_position(position_id, "take_profit")
                     return
@@ -846,8 +935,6 @@ class VALRTradingEngine:
                 if not sl_exists and tp_exists:
                     self.logger.info(f"SL order {sl_id} not found on VALR for {pair}. Likely filled. Cancelling TP...")
                     self._cancel_if_open(tp_id, pair=pair)
-                    if tp_id:
-                        self.order_persistence.update_order_status(tp_id, "cancelled")
                     # Position already sold via SL, just close tracking
                     self.position_manager.close_position(position_id, "stop_loss")
                     return
@@ -857,22 +944,10 @@ class VALRTradingEngine:
                 # Continue with normal flow if check fails
 
         # CRITICAL: Fetch BOTH order statuses before taking any action (prevents race condition)
-        tp_status = None
-        sl_status = None
-
-        if tp_id:
-            try:
-                tp_data = self.api.get_order_status(tp_id, pair=pair)
-                tp_status = self._extract_order_status(tp_data)
-            except Exception:
-                tp_status = None
-
-        if sl_id:
-            try:
-                sl_data = self.api.get_order_status(sl_id, pair=pair)
-                sl_status = self._extract_order_status(sl_data)
-            except Exception:
-                sl_status = None
+        exit_ids = [(pair, order_id) for order_id in (tp_id, sl_id) if order_id]
+        statuses = self.api.get_order_statuses(exit_ids) if exit_ids else {}
+        tp_status = self._extract_order_status(statuses[tp_id]) if tp_id in statuses else None
+        sl_status = self._extract_order_status(statuses[sl_id]) if sl_id in statuses else None
 
         # Check if both statuses are filled (race condition detected)
         tp_filled = tp_status and _status_is_filled(tp_status)
@@ -896,9 +971,7 @@ class VALRTradingEngine:
             self.logger.info(f"Take profit filled for {pair}. Cancelling stop loss...")
             if tp_id:
                 self.order_persistence.update_order_status(tp_id, "filled")
-            self._cancel_if_open(sl_id)
-            if sl_id:
-                self.order_persistence.update_order_status(sl_id, "cancelled")
+            self._cancel_if_open(sl_id, pair=pair)
 
             # Calculate PnL for TP exit
             tp_price = position.get("take_profit_price")
@@ -906,8 +979,8 @@ class VALRTradingEngine:
 
             # Track as win
             if pnl and pnl > 0:
-                self.wins_today += 1
-                self.daily_pnl += pnl
+                with self._stats_lock:
+                    self._stats = replace(self._stats, wins=self._stats.wins + 1, pnl=self._stats.pnl + pnl)
                 self.logger.info(f"WIN: {pair} closed at TP. PnL: +R{pnl:.2f}")
             return
 
@@ -915,9 +988,7 @@ class VALRTradingEngine:
             self.logger.info(f"Stop loss filled for {pair}. Cancelling take profit...")
             if sl_id:
                 self.order_persistence.update_order_status(sl_id, "filled")
-            self._cancel_if_open(tp_id)
-            if tp_id:
-                self.order_persistence.update_order_status(tp_id, "cancelled")
+            self._cancel_if_open(tp_id, pair=pair)
 
             # Calculate PnL for SL exit
             sl_price = position.get("stop_loss_price")
@@ -925,38 +996,44 @@ class VALRTradingEngine:
 
             # Track as loss
             if pnl and pnl < 0:
-                self.losses_today += 1
-                self.daily_pnl += pnl
+                with self._stats_lock:
+                    self._stats = replace(self._stats, losses=self._stats.losses + 1, pnl=self._stats.pnl + pnl)
                 self.logger.info(f"LOSS: {pair} closed at SL. PnL: R{pnl:.2f}")
             return
 
-    def _is_daily_limit_reached(self) -> bool:
-        current_date = datetime.now(timezone.utc).date()
-        if current_date != self.last_trade_date:
-            self.trades_today = 0
-            self.wins_today = 0
-            self.losses_today = 0
-            self.daily_pnl = Decimal("0")
-            self.last_trade_date = current_date
-        return self.trades_today >= self.config.MAX_DAILY_TRADES
+    def _maybe_roll_date(self, today: Optional[date] = None) -> DailyStats:
+        """Reset the daily counters if the UTC date has changed; return the current stats."""
+        if today is None:
+            today = datetime.now(timezone.utc).date()
+        with self._stats_lock:
+            if today != self._stats.trade_date:
+                self._stats = DailyStats(trade_date=today)
+            return self._stats
+
+    def _daily_limit_reached(self, stats: DailyStats) -> bool:
+        return stats.trades >= self.config.MAX_DAILY_TRADES
 
     def _increment_trade_count(self) -> None:
-        self.trades_today += 1
-        self.logger.debug(f"Trade count today: {self.trades_today}/{self.config.MAX_DAILY_TRADES}")
+        with self._stats_lock:
+            self._stats = replace(self._stats, trades=self._stats.trades + 1)
+            trades = self._stats.trades
+        self.logger.debug(f"Trade count today: {trades}/{self.config.MAX_DAILY_TRADES}")
 
     def get_trading_statistics(self) -> Dict:
         open_positions = self.position_manager.get_open_positions()
-        total_closed = self.wins_today + self.losses_today
-        win_rate = (self.wins_today / total_closed * 100) if total_closed > 0 else 0.0
+        # One reference gives a consistent view of all counters without locking
+        stats = self._stats
+        total_closed = stats.wins + stats.losses
+        win_rate = (stats.wins / total_closed * 100) if total_closed > 0 else 0.0
 
         return {
-            "trades_today": self.trades_today,
+            "trades_today": stats.trades,
             "max_daily_trades": self.config.MAX_DAILY_TRADES,
-            "daily_limit_reached": self._is_daily_limit_reached(),
+            "daily_limit_reached": self._daily_limit_reached(stats),
             "open_positions": len(open_positions),
-            "wins_today": self.wins_today,
-            "losses_today": self.losses_today,
+            "wins_today": stats.wins,
+            "losses_today": stats.losses,
             "win_rate": f"{win_rate:.1f}%",
-            "daily_pnl": f"R{self.daily_pnl:.2f}",
-            "last_trade_date": self.last_trade_date.isoformat(),
+            "daily_pnl": f"R{stats.pnl:.2f}",
+            "last_trade_date": stats.trade_date.isoformat(),
         }
@@ -3,20 +3,118 @@
 Implements signature-based authentication and connection pooling.
 """
 
+import random
 import time
-import hmac
+import threading
 import hashlib
-import json
-from decimal import Decimal
-from typing import Dict, List, Optional, Any
+import math
+import socket
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Mapping, Optional, Any, Set, Tuple
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from urllib.parse import urlencode
+
+import certifi
+import urllib3
+from urllib3.connection import HTTPConnection
 
 from config import Config
 from logging_setup import get_logger, get_valr_logger
 
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> bytes:
+        # Compact separators and raw UTF-8, as orjson emits
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+
+# urllib3 already sets TCP_NODELAY by default; SO_KEEPALIVE is added so idle
+# pooled connections are not silently dropped by middleboxes between calls
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+_SHA512_BLOCK_SIZE = hashlib.sha512().block_size
+_HMAC_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+_HMAC_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
+
+# Keys VALR may wrap list payloads under, in lookup order
+_BALANCE_KEYS = ("balances", "data", "items")
+_ORDER_KEYS = ("orders", "data", "items")
+_TRADE_KEYS = ("trades", "data", "items")
+_FILL_KEYS = ("fills", "data", "items")
+# Market summary fields that may carry the last traded price, in preference order
+_PRICE_KEYS = ("lastTradedPrice", "lastPrice", "price", "last")
+# Longest server-requested quiet period honoured after a 429
+_MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def _extract_items(raw: Any, keys: Tuple[str, ...]) -> List[Any]:
+    """Return the list payload of a response that is either a bare list or wrapped under one of keys."""
+    if isinstance(raw, list):
+        return raw
+    if isinstance(raw, dict):
+        for key in keys:
+            items = raw.get(key)
+            if items:
+                return items if isinstance(items, list) else []
+    return []
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP-date.
+
+    Non-finite values are rejected and the result is capped at
+    ``_MAX_RETRY_AFTER_SECONDS``, since the wait pauses every caller.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        seconds = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return min(max(0.0, seconds), _MAX_RETRY_AFTER_SECONDS)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert an API amount to Decimal, treating malformed values as zero."""
+    try:
+        # VALR sends amounts as strings; only non-strings need the str() round-trip
+        return Decimal(value) if isinstance(value, str) else Decimal(str(value))
+    except InvalidOperation:
+        return Decimal("0")
+
+
+# Pre-encoded HTTP verbs for request signing
+_METHOD_BYTES = {method: method.encode("ascii") for method in ("GET", "POST", "PUT", "DELETE")}
+
+# Upper bound on memoized endpoint URLs; a safety net, as per-order endpoints are never cached
+_ENDPOINT_CACHE_SIZE = 128
+
+
+def _is_per_order_endpoint(endpoint: str) -> bool:
+    # Static order endpoints are "/orders/<action>"; anything deeper embeds an order id
+    return endpoint.startswith("/orders/") and endpoint.count("/") > 2
+
 
 class VALRAPIError(Exception):
     """Base exception for VALR API errors."""
@@ -42,9 +140,12 @@ class VALRConnectionError(VALRAPIError):
 class VALRAPIResponse:
     """Wrapper for VALR API responses."""
 
-    def __init__(self, data: Any, status_code: int, headers: Dict[str, str]):
+    __slots__ = ("data", "status_code", "headers")
+
+    def __init__(self, data: Any, status_code: int, headers: Mapping[str, str]):
         self.data = data
         self.status_code = status_code
+        # The transport's case-insensitive header mapping, kept as-is rather than copied
         self.headers = headers
 
     def is_success(self) -> bool:
@@ -53,6 +154,9 @@ class VALRAPIResponse:
     def is_rate_limited(self) -> bool:
         return self.status_code == 429
 
+    def is_server_error(self) -> bool:
+        return self.status_code in (500, 502, 503, 504)
+
     def get_error_message(self) -> str:
         if isinstance(self.data, dict):
             return self.data.get("message", self.data.get("error", "Unknown error"))
@@ -60,117 +164,252 @@ class VALRAPIResponse:
 
 
 class VALRRateLimiter:
-    """Rate limiter for VALR API calls."""
+    """Rate limiter for VALR API calls (generic cell rate algorithm).
+
+    Tracks a single next-allowed timestamp advancing by ``60 / max_requests_per_minute``
+    seconds per request, with burst tolerance of ``max_requests_per_minute`` requests,
+    the same shape as a token bucket of that capacity. Server-imposed quiet periods
+    (429 responses) push the same timestamp forward, so callers only ever wait once.
+    """
 
     def __init__(self, max_requests_per_minute: int):
         self.max_requests = max_requests_per_minute
-        self.requests: List[float] = []
+        self.interval = 60.0 / max_requests_per_minute
+        self.burst = (max_requests_per_minute - 1) * self.interval
+        # Theoretical arrival time of the next request at the steady rate
+        self._tat = time.monotonic()
+        self._lock = threading.Lock()
         self.logger = get_logger("rate_limiter")
 
-    def wait_if_needed(self) -> None:
-        now = time.time()
-        self.requests = [req_time for req_time in self.requests if now - req_time < 60]
+    def _reserve(self) -> float:
+        """Claim the next request slot and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            tat = max(self._tat, now)
+            self._tat = tat + self.interval
+            return tat - self.burst - now
 
-        if len(self.requests) >= self.max_requests:
-            oldest_request = min(self.requests)
-            wait_time = 60 - (now - oldest_request) + 0.1
-            if wait_time > 0:
-                self.logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
-                self.requests = [req_time for req_time in self.requests if now - req_time < 60]
+    def wait_if_needed(self) -> None:
+        # Sleep outside the lock so other threads can reserve their own slots meanwhile
+        wait_time = self._reserve()
+        if wait_time > 0:
+            self.logger.debug(f"Rate limit reached, waiting {wait_time:.2f} seconds")
+            time.sleep(wait_time)
 
-        self.requests.append(now)
+    def pause(self, seconds: float) -> None:
+        """Hold off all callers for at least ``seconds``, e.g. after the server answers 429."""
+        with self._lock:
+            self._tat = max(self._tat, time.monotonic() + seconds + self.burst)
 
 
 class VALRAPI:
     """VALR API client with comprehensive error handling and retry logic."""
 
+    # Interval for the background request that keeps the pooled TLS connection warm
+    KEEPALIVE_INTERVAL_SECONDS = 25
+    # Worker threads for fetching independent endpoints concurrently
+    FETCH_WORKERS = 8
+    # How long a market summary is reused before it is fetched again
+    MARKET_SUMMARY_TTL_SECONDS = 0.25
+
     def __init__(self, config: Config):
         self.config = config
         self.logger = get_logger("valr_api")
         self.valr_logger = get_valr_logger()
 
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=config.MAX_RETRIES,
-            backoff_factor=config.RETRY_BACKOFF_FACTOR,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "POST", "PUT", "DELETE", "OPTIONS", "TRACE"],
+        # Every call targets the same host, so hold its connection pool directly and
+        # skip the per-request host lookup a PoolManager does. Transport-level retries
+        # are off; _send owns the retry loop. TLS is verified against certifi's CA
+        # bundle so hosts without a usable system trust store still connect.
+        self.pool = urllib3.connection_from_url(
+            config.VALR_BASE_URL,
+            maxsize=20,
+            block=False,
+            retries=False,
+            socket_options=_SOCKET_OPTIONS,
+            ca_certs=certifi.where(),
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=10, pool_maxsize=20)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
 
         self.rate_limiter = VALRRateLimiter(config.RATE_LIMIT_REQUESTS_PER_MINUTE)
+        # Exponential retry delays per attempt; jitter is added at use so clients don't retry in lockstep
+        self._backoff = tuple(config.RETRY_BACKOFF_FACTOR * (1 << i) for i in range(config.MAX_RETRIES + 1))
+
+        # Pre-keyed HMAC-SHA512 inner/outer states; each signature copies them instead of re-keying
+        key_block = config.VALR_API_SECRET.encode("utf-8")
+        if len(key_block) > _SHA512_BLOCK_SIZE:
+            key_block = hashlib.sha512(key_block).digest()
+        key_block = key_block.ljust(_SHA512_BLOCK_SIZE, b"\x00")
+        self._hmac_inner = hashlib.sha512(key_block.translate(_HMAC_TRANS_36))
+        self._hmac_outer = hashlib.sha512(key_block.translate(_HMAC_TRANS_5C))
+
+        self._path_prefix = f"/{config.VALR_API_VERSION}"
+        self._endpoint_cache: Dict[str, Tuple[str, bytes]] = {}
+        # pair -> (monotonic fetch time, summary); cleared whenever we place or cancel an order
+        self._summary_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # Static request headers; only the signature and timestamp change per call
+        self._headers_template = {
+            "X-VALR-API-KEY": config.VALR_API_KEY,
+            "Content-Type": "application/json",
+        }
+
+        self._keepalive_stop = threading.Event()
+        # Monotonic time of the last response from the exchange, read by the keepalive thread
+        self._last_response_at = time.monotonic()
+        self._keepalive_thread: Optional[threading.Thread] = None
+
+        # Pool for overlapping independent requests; the connection pool and rate limiter are thread-safe
+        self._fetch_pool = ThreadPoolExecutor(max_workers=self.FETCH_WORKERS, thread_name_prefix="valr_fetch")
 
-        self.base_url = f"{config.VALR_BASE_URL}/{config.VALR_API_VERSION}"
+        # Open the first pooled connection now so the first real call skips the TLS handshake
+        self._warm_up()
 
-    def _generate_signature(self, timestamp: str, method: str, path: str, body: Optional[str] = None) -> str:
-        message = timestamp + method.upper() + path + (body or "")
-        secret_bytes = self.config.VALR_API_SECRET.encode("utf-8")
-        message_bytes = message.encode("utf-8")
-        return hmac.new(secret_bytes, message_bytes, hashlib.sha512).hexdigest()
+    def _warm_up(self) -> None:
+        """Hit the public server-time endpoint to open or refresh a pooled connection."""
+        try:
+            self.pool.urlopen("GET", f"{self._path_prefix}/public/time", timeout=self.config.REQUEST_TIMEOUT)
+        except urllib3.exceptions.HTTPError as e:
+            self.logger.debug(f"Connection warm-up failed: {e}")
+
+    def start_keepalive(self) -> None:
+        """Start a background thread that keeps the pooled connection warm while idle."""
+        if self._keepalive_thread is not None:
+            return
+
+        def _run() -> None:
+            interval = self.KEEPALIVE_INTERVAL_SECONDS
+            while not self._keepalive_stop.wait(interval):
+                # Real traffic already keeps the connection warm; only ping after a quiet interval
+                idle = time.monotonic() - self._last_response_at
+                if idle < self.KEEPALIVE_INTERVAL_SECONDS:
+                    interval = self.KEEPALIVE_INTERVAL_SECONDS - idle
+                    continue
+                interval = self.KEEPALIVE_INTERVAL_SECONDS
+                self.rate_limiter.wait_if_needed()
+                self._warm_up()
+
+        self._keepalive_thread = threading.Thread(target=_run, name="valr_keepalive", daemon=True)
+        self._keepalive_thread.start()
+
+    def fetch_concurrently(self, *calls: Callable[[], Any]) -> List[Any]:
+        """Run independent API calls in parallel and return their results in call order.
+
+        Each call still passes through the shared rate limiter. The first exception raised
+        by any call is re-raised once all of them have finished.
+        """
+        if len(calls) <= 1:
+            return [call() for call in calls]
+        futures = [self._fetch_pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
+
+    def _backoff_delay(self, attempt: int) -> float:
+        base = self._backoff[attempt]
+        return base + random.uniform(0, base * 0.2)
+
+    def _generate_signature(self, timestamp: bytes, method: bytes, path: bytes, body: bytes = b"") -> str:
+        # HMAC(K, m) = H((K ^ opad) || H((K ^ ipad) || m)), equivalent to hmac.new(secret, message, sha512).
+        # The pre-encoded parts are fed to the hasher in turn rather than concatenated first.
+        inner = self._hmac_inner.copy()
+        inner.update(timestamp)
+        inner.update(method)
+        inner.update(path)
+        if body:
+            inner.update(body)
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
+    def _endpoint_parts(self, endpoint: str) -> Tuple[str, bytes]:
+        """Return the versioned request path and its signing bytes for an endpoint."""
+        parts = self._endpoint_cache.get(endpoint)
+        if parts is None:
+            path = self._path_prefix + endpoint
+            parts = (path, path.encode("utf-8"))
+            if len(self._endpoint_cache) < _ENDPOINT_CACHE_SIZE and not _is_per_order_endpoint(endpoint):
+                self._endpoint_cache[endpoint] = parts
+        return parts
 
     def _make_request(
         self, method: str, endpoint: str, data: Optional[Dict] = None, params: Optional[Dict] = None
     ) -> VALRAPIResponse:
-        url = f"{self.base_url}{endpoint}"
-        path = f"/{self.config.VALR_API_VERSION}{endpoint}"
-
         # For VALR API, DELETE requests send body as JSON, not as query params
         # For GET requests, use params; for POST/PUT/DELETE, use data
-        if method.upper() == "GET":
-            body = ""
-        else:
-            # For POST, PUT, DELETE: send data as JSON body
-            body = json.dumps(data) if data else ""
-            params = None  # VALR API doesn't use params for non-GET requests
-
-        timestamp = str(int(time.time() * 1000))
-        signature = self._generate_signature(timestamp, method, path, body)
-
-        headers = {
-            "X-VALR-API-KEY": self.config.VALR_API_KEY,
-            "X-VALR-SIGNATURE": signature,
-            "X-VALR-TIMESTAMP": timestamp,
-            "Content-Type": "application/json",
-        }
+        method = method.upper()
+        if method == "GET":
+            return self._get(endpoint, params)
+        return self._send(method, endpoint, _json_dumps(data) if data else b"")
+
+    def _get(self, endpoint: str, params: Optional[Dict] = None) -> VALRAPIResponse:
+        return self._send("GET", endpoint, b"", params)
+
+    def _post(self, endpoint: str, data: Dict) -> VALRAPIResponse:
+        if endpoint.startswith("/orders"):
+            self._summary_cache.clear()
+        return self._send("POST", endpoint, _json_dumps(data))
+
+    def _delete(self, endpoint: str, data: Optional[Dict] = None) -> VALRAPIResponse:
+        if endpoint.startswith("/orders"):
+            self._summary_cache.clear()
+        return self._send("DELETE", endpoint, _json_dumps(data) if data else b"")
+
+    def _send(
+        self, method: str, endpoint: str, body: bytes, params: Optional[Dict] = None
+    ) -> VALRAPIResponse:
+        """Sign and send a request with an already-serialized body; method must be uppercase."""
+        path, path_bytes = self._endpoint_parts(endpoint)
+        url = f"{path}?{urlencode(params)}" if params else path
 
-        self.rate_limiter.wait_if_needed()
+        method_bytes = _METHOD_BYTES.get(method) or method.encode("ascii")
+        headers = self._headers_template.copy()
+        signed_ms = -1
 
-        start_time = time.time()
+        start_time = time.monotonic()
         last_exception: Optional[Exception] = None
 
         for attempt in range(self.config.MAX_RETRIES + 1):
+            # Covers the request rate and any server-imposed 429 quiet period
+            self.rate_limiter.wait_if_needed()
+
+            # Sign per attempt so a retry after backoff never carries a stale timestamp;
+            # within the same millisecond the previous signature is still exact
+            now_ms = time.time_ns() // 1_000_000
+            if now_ms != signed_ms:
+                signed_ms = now_ms
+                timestamp = str(now_ms)
+                headers["X-VALR-SIGNATURE"] = self._generate_signature(
+                    timestamp.encode("ascii"), method_bytes, path_bytes, body
+                )
+                headers["X-VALR-TIMESTAMP"] = timestamp
+
             try:
                 self.logger.debug(f"Making {method} request to {endpoint} (attempt {attempt + 1})")
 
-                response = self.session.request(
-                    method=method,
-                    url=url,
+                response = self.pool.urlopen(
+                    method,
+                    url,
+                    body=body if body else None,
                     headers=headers,
-                    data=body if body else None,
-                    params=params,
                     timeout=self.config.REQUEST_TIMEOUT,
                 )
 
-                response_time = time.time() - start_time
+                self._last_response_at = time.monotonic()
+                response_time = self._last_response_at - start_time
                 self.valr_logger.log_api_call(
                     endpoint=path,
                     method=method,
-                    status_code=response.status_code,
+                    status_code=response.status,
                     response_time=response_time,
                 )
 
                 try:
                     # Handle DELETE requests that may return 204 No Content or 202 Accepted
-                    if response.status_code in (204, 202) and not response.content:
+                    if response.status in (204, 202) and not response.data:
                         response_data = {"success": True}
                     else:
-                        response_data: Any = response.json() if response.content else {}
-                except json.JSONDecodeError as e:
+                        response_data: Any = _json_loads(response.data) if response.data else {}
+                except _JSONDecodeError as e:
                     # DELETE requests may return 204/202 without body, which is fine
-                    if response.status_code in (204, 202):
+                    if response.status in (204, 202):
                         response_data = {"success": True}
                     else:
                         self.logger.error(f"Failed to parse JSON response: {e}")
@@ -178,36 +417,46 @@ class VALRAPI:
 
                 api_response = VALRAPIResponse(
                     data=response_data,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
+                    status_code=response.status,
+                    headers=response.headers,
                 )
 
                 if api_response.is_rate_limited():
                     if attempt < self.config.MAX_RETRIES:
-                        wait_time = 2**attempt * self.config.RETRY_BACKOFF_FACTOR
-                        self.logger.warning(f"Rate limited, waiting {wait_time}s before retry")
-                        time.sleep(wait_time)
+                        # Prefer the server's declared quiet period over an exponential guess
+                        wait_time = _retry_after_seconds(response.headers.get("Retry-After"))
+                        if wait_time is None:
+                            wait_time = self._backoff_delay(attempt)
+                        self.rate_limiter.pause(wait_time)
+                        self.logger.warning(f"Rate limited, waiting {wait_time:.2f}s before retry")
                         continue
                     raise VALRRateLimitError(f"Rate limit exceeded after {self.config.MAX_RETRIES} retries")
 
+                if api_response.is_server_error() and attempt < self.config.MAX_RETRIES:
+                    wait_time = self._backoff_delay(attempt)
+                    self.logger.warning(f"Server error {response.status}, retrying in {wait_time:.2f}s")
+                    # Back off this call only; other threads are not held up by one failing request
+                    time.sleep(wait_time)
+                    continue
+
                 if not api_response.is_success():
                     error_msg = api_response.get_error_message()
                     error_code = response_data.get("code") if isinstance(response_data, dict) else None
                     raise VALRAPIErrorCode(
                         f"API error: {error_msg}",
                         error_code=error_code,
-                        status_code=response.status_code,
+                        status_code=response.status,
                     )
 
                 return api_response
 
-            except requests.exceptions.RequestException as e:
+            except urllib3.exceptions.HTTPError as e:
                 last_exception = e
                 self.logger.warning(f"Request failed (attempt {attempt + 1}): {e}")
 
                 if attempt < self.config.MAX_RETRIES:
-                    wait_time = 2**attempt * self.config.RETRY_BACKOFF_FACTOR
-                    self.logger.debug(f"Retrying in {wait_time} seconds...")
+                    wait_time = self._backoff_delay(attempt)
+                    self.logger.debug(f"Retrying in {wait_time:.2f} seconds...")
                     time.sleep(wait_time)
                     continue
 
@@ -248,29 +497,13 @@ class VALRAPI:
             return int(time.time() * 1000)
 
     def get_account_balances(self) -> Dict[str, Decimal]:
-        response = self._make_request_with_fallback("GET", ["/account/balances"])  # v1 prefix handled by base_url
-
-        raw = response.data
-        if isinstance(raw, dict):
-            items = raw.get("balances") or raw.get("data") or raw.get("items") or []
-        elif isinstance(raw, list):
-            items = raw
-        else:
-            items = []
-
-        balances: Dict[str, Decimal] = {}
-        for balance_data in items:
-            if not isinstance(balance_data, dict):
-                continue
-            currency = balance_data.get("currency")
-            available_str = balance_data.get("available") or balance_data.get("availableBalance") or "0"
-            if not currency:
-                continue
-            try:
-                available = Decimal(str(available_str))
-            except Exception:
-                available = Decimal("0")
-            balances[currency] = available
+        response = self._make_request_with_fallback("GET", ["/account/balances"])  # v1 prefix added by _endpoint_parts
+
+        balances: Dict[str, Decimal] = {
+            b["currency"]: _to_decimal(b.get("available") or b.get("availableBalance") or "0")
+            for b in _extract_items(response.data, _BALANCE_KEYS)
+            if isinstance(b, dict) and b.get("currency")
+        }
 
         self.logger.debug(f"Account balances: {balances}")
         return balances
@@ -279,36 +512,39 @@ class VALRAPI:
         """Get trading pair summary using VALR v1 API.
 
         For scalp trading, we need reliable market data endpoints.
-        VALR v1 provides market summaries via public endpoints.
+        VALR v1 provides market summaries via public endpoints. Summaries are
+        reused for MARKET_SUMMARY_TTL_SECONDS so back-to-back reads share one request.
         """
 
+        cached = self._summary_cache.get(pair)
+        if cached is not None and time.monotonic() - cached[0] < self.MARKET_SUMMARY_TTL_SECONDS:
+            return cached[1]
+
         endpoints = [
             f"/public/{pair}/marketsummary",
             f"/marketsummary/pair/{pair}",
         ]
         response = self._make_request_with_fallback("GET", endpoints)
-        return response.data if isinstance(response.data, dict) else {"data": response.data}
+        summary = response.data if isinstance(response.data, dict) else {"data": response.data}
+        self._summary_cache[pair] = (time.monotonic(), summary)
+        return summary
 
     def get_last_traded_price(self, pair: str) -> Decimal:
         summary = self.get_pair_summary(pair)
-        for key in [
-            "lastTradedPrice",
-            "lastPrice",
-            "price",
-            "last",
-        ]:
-            if key in summary:
+        data = summary.get("data")
+        sources = (summary, data) if isinstance(data, dict) else (summary,)
+
+        # First price field that parses, top level before the nested data dict
+        for src in sources:
+            for key in _PRICE_KEYS:
+                value = src.get(key)
+                if value is None:
+                    continue
                 try:
-                    return Decimal(str(summary[key]))
-                except Exception:
+                    return Decimal(value) if isinstance(value, str) else Decimal(str(value))
+                except InvalidOperation:
                     continue
 
-        if "data" in summary and isinstance(summary["data"], dict):
-            data = summary["data"]
-            for key in ["lastTradedPrice", "lastPrice", "price", "last"]:
-                if key in data:
-                    return Decimal(str(data[key]))
-
         raise VALRAPIError(f"Could not extract last traded price for {pair} from response: {summary}")
 
     def get_order_book(self, pair: str) -> Dict[str, Any]:
@@ -322,7 +558,7 @@ class VALRAPI:
         endpoint = f"/public/{pair}/orderbook"
         
         try:
-            response = self._make_request("GET", endpoint)
+            response = self._get(endpoint)
             return response.data if isinstance(response.data, dict) else {"data": response.data}
         except VALRAPIErrorCode as e:
             if e.status_code != 404:
@@ -360,7 +596,7 @@ class VALRAPI:
 
         try:
             self.logger.info(f"Placing {side_normalized} order: {quantity} {pair} @ {price} (postOnly={post_only})")
-            response = self._make_request("POST", endpoint, data=payload)
+            response = self._post(endpoint, payload)
             order_result = response.data if isinstance(response.data, dict) else {"data": response.data}
 
             order_id = order_result.get("id") or order_result.get("orderId") or order_result.get("data", {}).get("id")
@@ -369,8 +605,8 @@ class VALRAPI:
                 order_id=str(order_id or "unknown"),
                 pair=pair,
                 side=side_normalized,
-                quantity=float(Decimal(quantity)),
-                price=float(Decimal(price)),
+                quantity=float(quantity),
+                price=float(price),
             )
             return order_result
         except VALRAPIErrorCode as e:
@@ -397,7 +633,7 @@ class VALRAPI:
 
         try:
             self.logger.info(f"Placing {side_normalized} market order: {quantity} {pair}")
-            response = self._make_request("POST", endpoint, data=payload)
+            response = self._post(endpoint, payload)
             return response.data if isinstance(response.data, dict) else {"data": response.data}
         except VALRAPIErrorCode as e:
             self.logger.error(f"Failed to place {side_normalized} market order: {e}")
@@ -428,7 +664,7 @@ class VALRAPI:
         }
 
         try:
-            response = self._make_request("DELETE", endpoint, data=params)
+            response = self._delete(endpoint, params)
             self.valr_logger.log_order_event(event_type="CANCELLED", order_id=order_id, pair=pair, side="unknown")
             return response.is_success()
         except VALRAPIErrorCode as e:
@@ -451,25 +687,45 @@ class VALRAPI:
             raise ValueError("pair is required for get_order_status endpoint")
 
         endpoint = f"/orders/{pair}/orderid/{order_id}"
-        response = self._make_request("GET", endpoint)
+        response = self._get(endpoint)
         return response.data if isinstance(response.data, dict) else {"data": response.data}
 
+    def get_order_statuses(self, orders: List[Tuple[str, str]]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the status of several orders concurrently.
+
+        Args:
+            orders: (pair, order_id) tuples to look up
+
+        Returns:
+            Mapping of order ID to its status payload. Orders whose lookup failed are omitted.
+        """
+        if len(orders) == 1:
+            pair, order_id = orders[0]
+            try:
+                return {order_id: self.get_order_status(order_id, pair=pair)}
+            except Exception as e:
+                self.logger.debug(f"Failed to fetch status for order {order_id}: {e}")
+                return {}
+
+        futures = {
+            self._fetch_pool.submit(self.get_order_status, order_id, pair): order_id for pair, order_id in orders
+        }
+        statuses: Dict[str, Dict[str, Any]] = {}
+        for future in as_completed(futures):
+            order_id = futures[future]
+            try:
+                statuses[order_id] = future.result()
+            except Exception as e:
+                self.logger.debug(f"Failed to fetch status for order {order_id}: {e}")
+        return statuses
+
     def get_order_history(self, pair: Optional[str] = None, limit: int = 100) -> List[Dict]:
         params: Dict[str, Any] = {"limit": limit}
         if pair:
             params["pair"] = pair
 
         response = self._make_request_with_fallback("GET", ["/orders/history"], params=params)
-        raw = response.data
-
-        if isinstance(raw, dict):
-            items = raw.get("orders") or raw.get("data") or raw.get("items") or []
-        elif isinstance(raw, list):
-            items = raw
-        else:
-            items = []
-
-        return [item for item in items if isinstance(item, dict)]
+        return [item for item in _extract_items(response.data, _ORDER_KEYS) if isinstance(item, dict)]
 
     def get_trade_history(self, pair: Optional[str] = None, limit: int = 100) -> List[Dict]:
         params: Dict[str, Any] = {"limit": limit}
@@ -477,29 +733,11 @@ class VALRAPI:
             params["pair"] = pair
 
         response = self._make_request_with_fallback("GET", ["/orders/tradehistory"], params=params)
-        raw = response.data
-
-        if isinstance(raw, dict):
-            items = raw.get("trades") or raw.get("data") or raw.get("items") or []
-        elif isinstance(raw, list):
-            items = raw
-        else:
-            items = []
-
-        return [item for item in items if isinstance(item, dict)]
+        return [item for item in _extract_items(response.data, _TRADE_KEYS) if isinstance(item, dict)]
 
     def get_order_fills(self, order_id: str) -> List[Dict]:
         response = self._make_request_with_fallback("GET", [f"/orders/{order_id}/fills"])
-        raw = response.data
-
-        if isinstance(raw, dict):
-            items = raw.get("fills") or raw.get("data") or raw.get("items") or []
-        elif isinstance(raw, list):
-            items = raw
-        else:
-            items = []
-
-        return [item for item in items if isinstance(item, dict)]
+        return [item for item in _extract_items(response.data, _FILL_KEYS) if isinstance(item, dict)]
 
     def get_recent_trades(self, pair: str, limit: int = 100) -> List[Dict]:
         """Get recent trades for a trading pair.
@@ -517,47 +755,56 @@ class VALRAPI:
         endpoint = f"/public/{pair}/trades"
         
         try:
-            response = self._make_request("GET", endpoint)
-            raw = response.data
-            
-            if isinstance(raw, list):
-                return raw[:limit]
-            elif isinstance(raw, dict):
-                items = raw.get("trades") or raw.get("data") or raw.get("items") or []
-                return items[:limit] if isinstance(items, list) else []
-            
-            return []
+            response = self._get(endpoint)
+            return _extract_items(response.data, _TRADE_KEYS)[:limit]
         except Exception as e:
             self.logger.warning(f"Failed to fetch recent trades for {pair}: {e}")
             return []
 
-    def get_open_orders(self, pair: Optional[str] = None) -> List[Dict]:
+    def get_recent_trades_batch(self, pairs: List[str], limit: int = 100) -> Dict[str, List[Dict]]:
+        """Fetch recent trades for several pairs concurrently.
+
+        Requests share the client's rate limiter. Pairs whose fetch fails map to an
+        empty list, as with get_recent_trades.
+        """
+        trades = self.fetch_concurrently(*(lambda pair=pair: self.get_recent_trades(pair, limit) for pair in pairs))
+        return dict(zip(pairs, trades))
+
+    def get_open_orders(self, pair: Optional[str] = None) -> Tuple[List[Dict], Set[str]]:
         """Get all open (active) orders.
 
         Args:
             pair: Optional currency pair to filter by (not used - VALR API returns all open orders)
 
         Returns:
-            List of open order dictionaries
+            Tuple of (open order dictionaries, set of their order IDs). The ID set is
+            built while the response is parsed so callers can test membership directly.
         """
         endpoint = "/orders/open"
         try:
-            response = self._make_request("GET", endpoint)
-            raw = response.data
-            if isinstance(raw, dict):
-                items = raw.get("orders") or raw.get("data") or raw.get("items") or []
-            elif isinstance(raw, list):
-                items = raw
-            else:
-                items = []
-            return [item for item in items if isinstance(item, dict)]
+            response = self._get(endpoint)
+            items = _extract_items(response.data, _ORDER_KEYS)
+
+            orders: List[Dict] = []
+            order_ids: Set[str] = set()
+            for item in items:
+                if not isinstance(item, dict):
+                    continue
+                orders.append(item)
+                order_id = item.get("orderId") or item.get("id")
+                if order_id:
+                    order_ids.add(str(order_id))
+            return orders, order_ids
         except Exception as e:
             self.logger.warning(f"Failed to fetch open orders: {e}")
-            return []
+            return [], set()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if hasattr(self, "session"):
-            self.session.close()
+        self._keepalive_stop.set()
+        if hasattr(self, "_fetch_pool"):
+            self._fetch_pool.shutdown(wait=False)
+        if hasattr(self, "pool"):
+            self.pool.close()
@@ -5,7 +5,6 @@ Coordinates all components and implements the main trading loop.
 
 import signal
 import sys
-import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 import os
@@ -33,6 +32,8 @@ class VALRTradingBot:
         self.running = False
         self.scan_interval_seconds = 60  # Updated from config during initialization
         self.monitor_interval_seconds = 5  # Updated from config during initialization
+        self.reconcile_interval_seconds = 300  # Updated from config during initialization
+        self._stop_event = threading.Event()  # Wakes the main loop early on shutdown
         
         # Signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -42,6 +43,7 @@ class VALRTradingBot:
         """Handle shutdown signals gracefully."""
         self.logger.info(f"Received signal {signum}, initiating graceful shutdown...")
         self.running = False
+        self._stop_event.set()
     
     def initialize(self) -> None:
         """Initialize all components of the trading bot."""
@@ -57,12 +59,14 @@ class VALRTradingBot:
             # Apply runtime intervals from config
             self.scan_interval_seconds = self.config.SCAN_INTERVAL_SECONDS
             self.monitor_interval_seconds = self.config.POSITION_MONITOR_INTERVAL_SECONDS
+            self.reconcile_interval_seconds = self.config.ORDER_RECONCILE_INTERVAL_SECONDS
             
             # Initialize order persistence
             self.order_persistence = initialize_order_persistence(self.config)
             
             # Initialize VALR API client
             self.api = VALRAPI(self.config)
+            self.api.start_keepalive()
             
             # Test API connection (authenticated call)
             self.logger.info("Testing VALR API connection...")
@@ -106,8 +110,13 @@ class VALRTradingBot:
         self.running = True
         self.logger.info("Starting VALR Trading Bot main loop...")
 
-        last_scan_time = datetime.now(timezone.utc) - timedelta(seconds=self.scan_interval_seconds)
-        last_monitor_time = datetime.now(timezone.utc) - timedelta(seconds=self.monitor_interval_seconds)
+        scan_interval = timedelta(seconds=self.scan_interval_seconds)
+        monitor_interval = timedelta(seconds=self.monitor_interval_seconds)
+        reconcile_interval = timedelta(seconds=self.reconcile_interval_seconds)
+
+        last_scan_time = datetime.now(timezone.utc) - scan_interval
+        last_monitor_time = datetime.now(timezone.utc) - monitor_interval
+        last_reconcile_time = datetime.now(timezone.utc)
 
         try:
             while self.running:
@@ -123,12 +132,22 @@ class VALRTradingBot:
                     self._perform_rsi_scan()
                     last_scan_time = current_time
                 
+                # Order status reconciliation (low frequency, cancellations are tracked locally)
+                if (current_time - last_reconcile_time).total_seconds() >= self.reconcile_interval_seconds:
+                    self._reconcile_orders()
+                    last_reconcile_time = current_time
+                
                 # Cleanup old orders periodically
                 if current_time.hour == 0 and current_time.minute < 5:  # Run once daily at midnight
                     self._cleanup_old_orders()
                 
-                # Brief sleep to prevent tight loops
-                time.sleep(1)
+                # Sleep until the next task is due; a shutdown signal wakes the loop immediately
+                next_due = min(
+                    last_monitor_time + monitor_interval,
+                    last_scan_time + scan_interval,
+                    last_reconcile_time + reconcile_interval,
+                )
+                self._stop_event.wait(max(0.0, (next_due - datetime.now(timezone.utc)).total_seconds()))
                 
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
@@ -166,8 +185,6 @@ class VALRTradingBot:
                         )
                     else:
                         self.logger.warning(f"Failed to initiate trade for {pair}")
-                
-                time.sleep(0.1)  # Small delay between pairs
             
             # Log scan statistics
             oversold_count = sum(1 for r in scan_results if r.get("is_oversold", False))
@@ -192,6 +209,16 @@ class VALRTradingBot:
         except Exception as e:
             self.logger.error(f"Error monitoring positions: {e}")
     
+    def _reconcile_orders(self) -> None:
+        """Reconcile locally tracked order statuses with the exchange."""
+        try:
+            checked = self.trading_engine.reconcile_order_statuses()
+            if checked:
+                self.logger.info(f"Order reconciliation checked {checked} tracked orders")
+            
+        except Exception as e:
+            self.logger.error(f"Error reconciling orders: {e}")
+    
     def _cleanup_old_orders(self) -> None:
         """Cleanup old order records."""
         try:
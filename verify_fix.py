@@ -4,133 +4,187 @@ Simple test to verify the buy price fix for VALR trading bot.
 Tests the core price selection logic without full environment dependencies.
 """
 
-from decimal import Decimal
+import mmap
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+_ENV_PATH = '/home/engine/project/.env'
+_TRADING_ENGINE = '/home/engine/project/trading_engine.py'
+_FIX_NEEDLE = b'entry_price = best_ask if best_ask is not None else best_bid'
+
+_SEP50 = "=" * 50
+_SEP60 = "=" * 60
+_PRICE_HEADER = "🧪 Testing Price Selection Logic Fix\n" + _SEP50
+_RSI_HEADER = "\n🧪 Testing RSI Threshold Fix\n" + _SEP50
+_CODE_HEADER = "\n🧪 Testing Code Implementation\n" + _SEP50
+
+# KEY=VALUE lines, skipping comments; matched in C rather than via a Python line loop
+_ENV_LINE_RE = re.compile(r'(?m)^([^#\r\n][^=\r\n]*)=([^\r\n]*)')
+
+# Parsed .env contents keyed by (path, mtime_ns) so unchanged files are parsed once
+_ENV_CACHE = {}
+
+# Simulate order book data (based on user's example)
+# Market price: R1,469,322
+# BID: R1,469,300 (what buyers offer)
+# ASK: R1,469,314 (what sellers want)
+_ORDER_BOOK = {
+    "bids": [
+        {"price": "1469300", "quantity": "0.002041"}  # BID: What buyers offer
+    ],
+    "asks": [
+        {"price": "1469314", "quantity": "0.002041"}  # ASK: What sellers want
+    ]
+}
+_MARKET_PRICE = 1469322  # From user's example
+
+def _best_quotes():
+    """Return (best_bid, best_ask); whole-rand prices, so plain ints are exact."""
+    return int(_ORDER_BOOK["bids"][0]["price"]), int(_ORDER_BOOK["asks"][0]["price"])
+
+def _code_fix_present():
+    """Search the mapped trading_engine.py in place instead of reading it into a string."""
+    with open(_TRADING_ENGINE, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(_FIX_NEEDLE) != -1
+
+def _load_env(path):
+    """Return KEY=VALUE pairs from an env file, re-parsing only when its mtime changes."""
+    key = (path, os.stat(path).st_mtime_ns)
+    env = _ENV_CACHE.get(key)
+    if env is None:
+        # read_text sizes a single read to the file instead of refilling a fixed buffer
+        env = {name: value.strip() for name, value in _ENV_LINE_RE.findall(Path(path).read_text())}
+        _ENV_CACHE[key] = env
+    return env
 
 def test_price_selection_logic():
-    """Test the price selection logic with mock order book data."""
+    """Test the price selection logic with mock order book data. Returns (passed, report)."""
+    out = []
     
-    print("🧪 Testing Price Selection Logic Fix")
-    print("=" * 50)
+    out.append(_PRICE_HEADER)
     
-    # Simulate order book data (based on user's example)
-    # Market price: R1,469,322
-    # BID: R1,469,300 (what buyers offer)
-    # ASK: R1,469,314 (what sellers want)
+    best_bid, best_ask = _best_quotes()
+    market_price = _MARKET_PRICE
     
-    order_book = {
-        "bids": [
-            {"price": "1469300", "quantity": "0.002041"}  # BID: What buyers offer
-        ],
-        "asks": [
-            {"price": "1469314", "quantity": "0.002041"}  # ASK: What sellers want
-        ]
-    }
-    
-    # Extract best prices
-    best_bid = Decimal(str(order_book["bids"][0]["price"]))
-    best_ask = Decimal(str(order_book["asks"][0]["price"]))
-    market_price = Decimal("1469322")  # From user's example
+    out.append(f"📊 Market Analysis:")
+    out.append(f"   Current Market Price: R{market_price:,.2f}")
+    out.append(f"   Best BID (buyers offer): R{best_bid:,.2f}")
+    out.append(f"   Best ASK (sellers want): R{best_ask:,.2f}")
+    out.append(f"   Bid-Ask Spread: R{best_ask - best_bid:,.2f}")
+    out.append("")
     
-    print(f"📊 Market Analysis:")
-    print(f"   Current Market Price: R{float(market_price):,.2f}")
-    print(f"   Best BID (buyers offer): R{float(best_bid):,.2f}")
-    print(f"   Best ASK (sellers want): R{float(best_ask):,.2f}")
-    print(f"   Bid-Ask Spread: R{float(best_ask - best_bid):,.2f}")
-    print()
+    out.append("🎯 OLD (Broken) Logic:")
+    out.append(f"   Buy Order Price: R{best_bid:,.2f} (using BID)")
+    out.append(f"   Problem: BID < ASK, order sits waiting (never fills for scalp trading)")
+    out.append(f"   User reported: Bot placed at R1,470,114 (HIGHER than market!)")
+    out.append("")
     
-    print("🎯 OLD (Broken) Logic:")
-    print(f"   Buy Order Price: R{float(best_bid):,.2f} (using BID)")
-    print(f"   Problem: BID < ASK, order sits waiting (never fills for scalp trading)")
-    print(f"   User reported: Bot placed at R1,470,114 (HIGHER than market!)")
-    print()
-    
-    print("✨ NEW (Fixed) Logic:")
-    print(f"   Buy Order Price: R{float(best_ask):,.2f} (using ASK)")
-    print(f"   Benefit: ASK ≈ market price, immediate fills for scalp trading")
-    print(f"   Expected: Order fills quickly (maker/taker fees acceptable for quick entries)")
-    print()
+    out.append("✨ NEW (Fixed) Logic:")
+    out.append(f"   Buy Order Price: R{best_ask:,.2f} (using ASK)")
+    out.append(f"   Benefit: ASK ≈ market price, immediate fills for scalp trading")
+    out.append(f"   Expected: Order fills quickly (maker/taker fees acceptable for quick entries)")
+    out.append("")
     
     # Verify the logic
     if best_ask > best_bid:
-        print("✅ PRICE SELECTION FIXED:")
-        print(f"   • Buy orders now use ASK price (R{float(best_ask):,.2f})")
-        print(f"   • This is R{float(best_ask - best_bid):,.2f} higher than BID (correct)")
-        print(f"   • Should result in immediate fills for scalp trading")
-        return True
+        out.append("✅ PRICE SELECTION FIXED:")
+        out.append(f"   • Buy orders now use ASK price (R{best_ask:,.2f})")
+        out.append(f"   • This is R{best_ask - best_bid:,.2f} higher than BID (correct)")
+        out.append(f"   • Should result in immediate fills for scalp trading")
+        return True, "\n".join(out)
     else:
-        print("❌ ERROR: Price logic still incorrect")
-        return False
+        out.append("❌ ERROR: Price logic still incorrect")
+        return False, "\n".join(out)
 
 def test_rsi_threshold_fix():
-    """Test RSI threshold configuration."""
+    """Test RSI threshold configuration. Returns (passed, report)."""
+    out = []
+    
+    out.append(_RSI_HEADER)
     
-    print("\n🧪 Testing RSI Threshold Fix")
-    print("=" * 50)
+    # Check for the file up front rather than unwinding a FileNotFoundError
+    if not os.path.isfile(_ENV_PATH):
+        out.append("❌ ERROR: .env file not found")
+        return False, "\n".join(out)
     
     # Read the .env file to verify the threshold
     try:
-        with open('/home/engine/project/.env', 'r') as f:
-            env_content = f.read()
-        
-        # Find RSI_THRESHOLD line
-        for line in env_content.split('\n'):
-            if line.startswith('RSI_THRESHOLD='):
-                threshold_value = line.split('=')[1].strip()
-                break
-        else:
-            threshold_value = None
+        threshold_value = _load_env(_ENV_PATH).get('RSI_THRESHOLD')
         
-        print(f"📊 RSI Threshold in .env file: {threshold_value}")
+        out.append(f"📊 RSI Threshold in .env file: {threshold_value}")
         
         if threshold_value == "45.0":
-            print("✅ RSI THRESHOLD FIXED:")
-            print("   • Threshold set to 45.0 (was incorrectly 80.0)")
-            print("   • Will now detect proper oversold conditions")
-            print("   • RSI values like 46, 42, 36 will trigger signals")
-            return True
+            out.append("✅ RSI THRESHOLD FIXED:")
+            out.append("   • Threshold set to 45.0 (was incorrectly 80.0)")
+            out.append("   • Will now detect proper oversold conditions")
+            out.append("   • RSI values like 46, 42, 36 will trigger signals")
+            return True, "\n".join(out)
         else:
-            print(f"❌ ERROR: RSI threshold should be 45.0, got {threshold_value}")
-            return False
+            out.append(f"❌ ERROR: RSI threshold should be 45.0, got {threshold_value}")
+            return False, "\n".join(out)
             
-    except FileNotFoundError:
-        print("❌ ERROR: .env file not found")
-        return False
     except Exception as e:
-        print(f"❌ ERROR reading .env file: {e}")
-        return False
+        out.append(f"❌ ERROR reading .env file: {e}")
+        return False, "\n".join(out)
 
 def test_code_fix():
-    """Test that the code change was applied correctly."""
+    """Test that the code change was applied correctly. Returns (passed, report)."""
+    out = []
     
-    print("\n🧪 Testing Code Implementation")
-    print("=" * 50)
+    out.append(_CODE_HEADER)
+    
+    if not os.path.isfile(_TRADING_ENGINE):
+        out.append("❌ ERROR: trading_engine.py not found")
+        return False, "\n".join(out)
     
     try:
-        with open('/home/engine/project/trading_engine.py', 'r') as f:
-            content = f.read()
-        
         # Look for the fixed line
-        if 'entry_price = best_ask if best_ask is not None else best_bid' in content:
-            print("✅ CODE FIX VERIFIED:")
-            print("   • trading_engine.py contains the corrected price selection")
-            print("   • Line: entry_price = best_ask if best_ask is not None else best_bid")
-            print("   • Buy orders now use ASK price for immediate fills")
-            return True
+        if _code_fix_present():
+            out.append("✅ CODE FIX VERIFIED:")
+            out.append("   • trading_engine.py contains the corrected price selection")
+            out.append("   • Line: entry_price = best_ask if best_ask is not None else best_bid")
+            out.append("   • Buy orders now use ASK price for immediate fills")
+            return True, "\n".join(out)
         else:
-            print("❌ ERROR: Code fix not found in trading_engine.py")
-            return False
+            out.append("❌ ERROR: Code fix not found in trading_engine.py")
+            return False, "\n".join(out)
             
-    except FileNotFoundError:
-        print("❌ ERROR: trading_engine.py not found")
-        return False
     except Exception as e:
-        print(f"❌ ERROR reading trading_engine.py: {e}")
+        out.append(f"❌ ERROR reading trading_engine.py: {e}")
+        return False, "\n".join(out)
+
+def _all_checks_pass():
+    """Evaluate every check without building any report text."""
+    best_bid, best_ask = _best_quotes()
+    if not (os.path.isfile(_ENV_PATH) and os.path.isfile(_TRADING_ENGINE)):
+        return False
+    try:
+        return (
+            best_ask > best_bid
+            and _load_env(_ENV_PATH).get('RSI_THRESHOLD') == "45.0"
+            and _code_fix_present()
+        )
+    except Exception:
         return False
 
 def main():
     """Run all tests"""
+    # --quiet: exit-status style run for CI, skipping all report formatting
+    if '--quiet' in sys.argv[1:]:
+        passed = _all_checks_pass()
+        print("PASS" if passed else "FAIL")
+        return passed
+
+    # Block-buffer stdout even on a terminal so the report goes out in a few writes, not one per line
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+
     print("🚀 VALR Bot Buy Price & RSI Fix Verification")
-    print("=" * 60)
+    print(_SEP60)
     print()
     print("Bug Report:")
     print("❌ Buy orders placed at ASK price (R1,470,114) > Market (R1,469,322)")
@@ -141,13 +195,21 @@ def main():
     print("✅ Reset RSI threshold to 45.0 (proper oversold detection)")
     print()
     
-    # Run tests
-    price_test = test_price_selection_logic()
-    rsi_test = test_rsi_threshold_fix()
-    code_test = test_code_fix()
+    # Run tests concurrently so the file reads overlap; reports print in a fixed order afterwards
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(test)
+            for test in (test_price_selection_logic, test_rsi_threshold_fix, test_code_fix)
+        ]
+        (price_test, price_report), (rsi_test, rsi_report), (code_test, code_report) = (
+            future.result() for future in futures
+        )
+    print(price_report)
+    print(rsi_report)
+    print(code_report)
     
     print("\n📋 FINAL TEST RESULTS:")
-    print("=" * 50)
+    print(_SEP50)
     print(f"Price Selection Logic: {'✅ PASSED' if price_test else '❌ FAILED'}")
     print(f"RSI Threshold Config:   {'✅ PASSED' if rsi_test else '❌ FAILED'}")
     print(f"Code Implementation:    {'✅ PASSED' if code_test else '❌ FAILED'}")
@@ -172,4 +234,7 @@ def main():
         return False
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    passed = main()
+    sys.stdout.flush()
+    if '--quiet' in sys.argv[1:]:
+        sys.exit(0 if passed else 1)
\ No newline at end of file